@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
 import logging
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
 from enum import Enum
 from typing import Annotated
 from typing import Any
 from typing import Literal
+from typing import TypeVar
 
 import httpx
 from pydantic import BaseModel
@@ -15,25 +23,26 @@ from pydantic import model_validator
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def extract_slug_from_url(value: str | None) -> str | None:
     if value is None:
         return None
-    return value.rstrip("/").split("/")[-1]
+    return value.rstrip("/").rpartition("/")[2]
 
 
 def extract_slugs_from_urls(value: list[str] | None) -> list[str] | None:
     if value is None:
         return None
-    slugs = [extract_slug_from_url(url) for url in value if url]
-    return [s for s in slugs if s is not None]
+    return [url.rstrip("/").rpartition("/")[2] for url in value if url]
 
 
 def parse_participant_list(value: str | list[str] | None) -> int | None:
     if value is None:
         return None
     participants = value.split(",") if isinstance(value, str) else value
-    return len([p.strip() for p in participants if p.strip()])
+    return sum(1 for p in participants if p and not p.isspace())
 
 
 CategorySlug = Annotated[str, BeforeValidator(extract_slug_from_url)]
@@ -106,49 +115,154 @@ SearchResultList = TypeAdapter(
 )
 
 
+def ttl_cached(
+    method: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """Cache a read-only client method's result per argument for `CACHE_TTL` seconds.
+
+    Arguments are bound to the method's signature, so positional and keyword
+    calls share a cache entry. Concurrent misses for the same entry wait on a
+    single in-flight request instead of each hitting the API. At most
+    `CACHE_MAXSIZE` entries are kept across all cached methods; the least
+    recently used entry is evicted first.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self: DjangoPackagesClient, *args: Any, **kwargs: Any) -> T:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__, *list(bound.arguments.values())[1:])
+
+        cached = self._cache.pop(key, None)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            logger.debug("Cache hit: %s%s", method.__name__, key[1:])
+            self._cache[key] = cached
+            return cached[1]
+
+        async def fetch() -> T:
+            try:
+                result = await method(*bound.args, **bound.kwargs)
+                self._cache[key] = (time.monotonic(), result)
+                if len(self._cache) > self.CACHE_MAXSIZE:
+                    del self._cache[next(iter(self._cache))]
+                return result
+            finally:
+                del self._inflight[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(fetch())
+
+        # Shielded so one caller being cancelled does not fail the others.
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
 class DjangoPackagesClient:
     BASE_URL_V3 = "https://djangopackages.org/api/v3"
     BASE_URL_V4 = "https://djangopackages.org/api/v4"
     TIMEOUT = 30.0
+    CACHE_TTL = 300.0
+    CACHE_MAXSIZE = 512
+    LIMITS = httpx.Limits(
+        max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0
+    )
 
     def __init__(self):
-        self.client = httpx.AsyncClient(
+        self.client = self._create_client()
+        self._cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+        self._etags: dict[str, tuple[str, bytes]] = {}
+        logger.debug("Django Packages client initialized")
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
             timeout=self.TIMEOUT,
+            limits=self.LIMITS,
             headers={"Content-Type": "application/json"},
         )
-        logger.debug("Django Packages client initialized")
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool.
+
+        The next request opens a new pool, so a shared client can be closed at
+        server shutdown and reused if the server is started again.
+        """
+        await self.client.aclose()
+
+    def clear_cache(self) -> None:
+        """Drop all cached API responses."""
+        self._cache.clear()
+        self._etags.clear()
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, *args: Any):
-        await self.client.aclose()
+        await self.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> bytes:
+        """Send a request and return the raw response body for `validate_json`.
+
+        Bodies served with an ETag are remembered, and later requests for the same
+        URL are made conditional, so an unchanged resource comes back as an empty
+        304 and the stored body is reused.
+        """
+        if self.client.is_closed:
+            self.client = self._create_client()
+
+        request = self.client.build_request(method, url, **kwargs)
+        key = str(request.url)
 
-    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
-        response = await self.client.request(method, url, **kwargs)
-        response.raise_for_status()
-        return response
+        stored = self._etags.get(key)
+        if stored is not None:
+            request.headers["If-None-Match"] = stored[0]
 
+        response = await self.client.send(request)
+        if stored is not None and response.status_code == 304:
+            logger.debug("Not modified: %s", key)
+            return stored[1]
+
+        if not response.is_success:
+            response.raise_for_status()
+
+        if etag := response.headers.get("ETag"):
+            self._etags.pop(key, None)
+            self._etags[key] = (etag, response.content)
+            if len(self._etags) > self.CACHE_MAXSIZE:
+                del self._etags[next(iter(self._etags))]
+
+        return response.content
+
+    @ttl_cached
     async def search(
         self,
         query: str,
     ) -> list[PackageSearchResult | GridSearchResult]:
-        logger.debug("Searching: query=%s", query)
-        response = await self._request(
+        content = await self._request(
             "GET", f"{self.BASE_URL_V4}/search/", params={"q": query}
         )
-        results = SearchResultList.validate_json(response.content)
-        logger.debug("Search complete: returned=%d", len(results))
-        return results
+        return SearchResultList.validate_json(content)
 
+    @ttl_cached
     async def get_package(self, slug_or_id: str) -> PackageResource:
         logger.debug("Fetching package: %s", slug_or_id)
-        response = await self._request(
+        content = await self._request(
             "GET", f"{self.BASE_URL_V3}/packages/{slug_or_id}/"
         )
-        return PackageResource.model_validate_json(response.content)
+        return PackageResource.model_validate_json(content)
 
+    async def get_packages(self, slugs: Iterable[str]) -> list[PackageResource]:
+        """Fetch several packages concurrently, preserving the order of `slugs`."""
+        return await asyncio.gather(*(self.get_package(slug) for slug in slugs))
+
+    @ttl_cached
     async def get_grid(self, slug_or_id: str) -> GridResource:
         logger.debug("Fetching grid: %s", slug_or_id)
-        response = await self._request("GET", f"{self.BASE_URL_V3}/grids/{slug_or_id}/")
-        return GridResource.model_validate_json(response.content)
+        content = await self._request("GET", f"{self.BASE_URL_V3}/grids/{slug_or_id}/")
+        return GridResource.model_validate_json(content)
+
+
+djangopackages_client = DjangoPackagesClient()
@@ -1,118 +1,151 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 from fastmcp import Context
 from fastmcp import FastMCP
 from fastmcp.resources import ResourceContent
 from mcp.types import ToolAnnotations
+from pydantic import Field
 
-from .client import DjangoPackagesClient
 from .client import GridResource
 from .client import GridSearchResult
 from .client import PackageResource
 from .client import PackageSearchResult
+from .client import djangopackages_client
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        await djangopackages_client.aclose()
+
+
 mcp = FastMCP(
     name="djangopackages.org",
     instructions="Search and discover reusable Django apps, sites, and tools from the community. Access package metadata including GitHub stars, PyPI versions, documentation links, and comparison grids for evaluating similar packages.",
+    lifespan=lifespan,
 )
 
 DJANGOPACKAGES_TOOLSET = "djangopackages"
 
+RESOURCE_ANNOTATIONS = {"readOnlyHint": True, "idempotentHint": True}
+READ_ONLY_TOOL_ANNOTATIONS = ToolAnnotations(readOnlyHint=True, idempotentHint=True)
+
+GridSlug = Annotated[str, "The grid slug (e.g., 'rest-frameworks', 'admin-interfaces')"]
+PackageSlug = Annotated[
+    str, "The package slug (e.g., 'django-debug-toolbar', 'django-rest-framework')"
+]
+
 
 async def get_grid(
-    slug: Annotated[
-        str,
-        "The grid slug (e.g., 'rest-frameworks', 'admin-interfaces')",
-    ],
+    slug: GridSlug,
 ) -> GridResource:
     """Get a specific comparison grid with all its packages.
 
     Returns detailed information about a grid including all packages
     that belong to it, allowing for easy comparison of similar tools.
     """
-    async with DjangoPackagesClient() as client:
-        return await client.get_grid(slug)
+    return await djangopackages_client.get_grid(slug)
 
 
 @mcp.resource(
     "django://grid/{slug}",
     name="Django Grid Details",
     mime_type="application/json",
-    annotations={"readOnlyHint": True, "idempotentHint": True},
+    annotations=RESOURCE_ANNOTATIONS,
     tags={DJANGOPACKAGES_TOOLSET},
 )
 async def get_grid_resource(
-    slug: Annotated[
-        str,
-        "The grid slug (e.g., 'rest-frameworks', 'admin-interfaces')",
-    ],
+    slug: GridSlug,
 ) -> list[ResourceContent]:
     return [ResourceContent(await get_grid(slug))]
 
 
 mcp.tool(
     name="get_grid",
-    annotations=ToolAnnotations(
-        title="djangopackages.org Grid Details",
-        readOnlyHint=True,
-        idempotentHint=True,
+    annotations=READ_ONLY_TOOL_ANNOTATIONS.model_copy(
+        update={"title": "djangopackages.org Grid Details"}
     ),
     tags={DJANGOPACKAGES_TOOLSET},
 )(get_grid)
 
 
 async def get_package(
-    slug: Annotated[
-        str,
-        "The package slug (e.g., 'django-debug-toolbar', 'django-rest-framework')",
-    ],
+    slug: PackageSlug,
 ) -> PackageResource:
     """Get detailed information about a specific Django package.
 
     Provides comprehensive package metadata including repository stats,
     PyPI information, documentation links, and grid memberships.
     """
-    async with DjangoPackagesClient() as client:
-        return await client.get_package(slug)
+    return await djangopackages_client.get_package(slug)
 
 
 @mcp.resource(
     "django://package/{slug}",
     name="Django Package Details",
     mime_type="application/json",
-    annotations={"readOnlyHint": True, "idempotentHint": True},
+    annotations=RESOURCE_ANNOTATIONS,
     tags={DJANGOPACKAGES_TOOLSET},
 )
 async def get_package_resource(
-    slug: Annotated[
-        str,
-        "The package slug (e.g., 'django-debug-toolbar', 'django-rest-framework')",
-    ],
+    slug: PackageSlug,
 ) -> list[ResourceContent]:
     return [ResourceContent(await get_package(slug))]
 
 
 mcp.tool(
     name="get_package",
-    annotations=ToolAnnotations(
-        title="djangopackages.org Package Details",
-        readOnlyHint=True,
-        idempotentHint=True,
+    annotations=READ_ONLY_TOOL_ANNOTATIONS.model_copy(
+        update={"title": "djangopackages.org Package Details"}
     ),
     tags={DJANGOPACKAGES_TOOLSET},
 )(get_package)
 
 
 @mcp.tool(
-    annotations=ToolAnnotations(
-        title="Search djangopackages.org",
-        readOnlyHint=True,
-        idempotentHint=True,
+    annotations=READ_ONLY_TOOL_ANNOTATIONS.model_copy(
+        update={"title": "djangopackages.org Package Details (Batch)"}
+    ),
+    tags={DJANGOPACKAGES_TOOLSET},
+)
+async def get_packages(
+    ctx: Context,
+    slugs: Annotated[
+        list[str],
+        Field(
+            description="Package slugs to fetch (e.g., the packages of a grid), at most 50",
+            min_length=1,
+            max_length=50,
+        ),
+    ],
+) -> list[PackageResource]:
+    """Get detailed information about several Django packages at once.
+
+    Fetches all packages concurrently, which is much faster than calling
+    get_package once per slug, e.g. to compare the packages of a grid.
+    Results are returned in the same order as the requested slugs.
+    """
+    logger.info(
+        "djangopackages.org get_packages called - request_id: %s, slugs: %d",
+        ctx.request_id,
+        len(slugs),
+    )
+
+    return await djangopackages_client.get_packages(slugs)
+
+
+@mcp.tool(
+    annotations=READ_ONLY_TOOL_ANNOTATIONS.model_copy(
+        update={"title": "Search djangopackages.org"}
     ),
     tags={DJANGOPACKAGES_TOOLSET},
 )
@@ -134,8 +167,7 @@ async def search(
         query,
     )
 
-    async with DjangoPackagesClient() as client:
-        results = await client.search(query=query)
+    results = await djangopackages_client.search(query=query)
 
     logger.debug(
         "djangopackages.org search completed - request_id: %s, results: %d",
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import os
 import sys
 import sysconfig
+from collections.abc import Callable
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 from typing import Literal
+from typing import TypeVar
 
 import django
 from django.apps import AppConfig
@@ -17,6 +21,8 @@ from django.db import models
 from pydantic import BaseModel
 from pydantic import field_serializer
 
+T = TypeVar("T")
+
 
 def get_source_file_path(obj: Any) -> Path:
     target = obj if inspect.isclass(obj) else obj.__class__
@@ -98,6 +104,30 @@ def filter_models(
     return filtered_models
 
 
+def cache_until_registry_changes(func: Callable[[], T]) -> Callable[[], T]:
+    """Cache the result of a zero-argument function until the app registry changes.
+
+    Django memoizes `apps.get_models()` and drops that cache whenever the app
+    registry is modified (`apps.clear_cache()`, e.g. when INSTALLED_APPS is
+    overridden or a model is registered), so the identity of the returned list
+    works as a cheap version token for anything derived from installed apps
+    and models.
+    """
+    cache: tuple[list[type[models.Model]], T] | None = None
+
+    @functools.wraps(func)
+    def wrapper() -> T:
+        nonlocal cache
+
+        token = apps.get_models()
+        if cache is None or cache[0] is not token:
+            cache = (token, func())
+
+        return cache[1]
+
+    return wrapper
+
+
 class ProjectResource(BaseModel):
     python: PythonResource
     django: DjangoResource
@@ -180,14 +210,8 @@ class AppResource(BaseModel):
         appconfig = get_source_file_path(app)
         app_path = appconfig.parent if appconfig != Path("unknown") else Path("unknown")
 
-        app_models = (
-            [
-                ModelResource.from_model(model)
-                for model in app.models.values()
-                if not model._meta.auto_created
-            ]
-            if app.models
-            else []
+        app_models = ModelResource.from_models(
+            model for model in app.models.values() if not model._meta.auto_created
         )
 
         return cls(name=app.name, label=app.label, path=app_path, models=app_models)
@@ -204,23 +228,60 @@ class ModelResource(BaseModel):
     fields: dict[str, str]
 
     @classmethod
-    def from_model(cls, model: type[models.Model]):
+    def from_model(cls, model: type[models.Model], source_path: Path | None = None):
         field_types = {
             field.name: field.__class__.__name__ for field in model._meta.fields
         }
 
+        if source_path is None:
+            source_path = get_source_file_path(model)
+
         return cls(
             model_class=model,
             import_path=f"{model.__module__}.{model.__name__}",
-            source_path=get_source_file_path(model),
+            source_path=source_path,
             fields=field_types,
         )
 
+    @classmethod
+    def from_models(
+        cls, model_classes: Iterable[type[models.Model]]
+    ) -> list[ModelResource]:
+        """Build resources for many models, resolving each source module only once.
+
+        Models are usually declared several to a module, so the source path lookup
+        is shared by every model from the same module instead of repeated per model.
+        """
+        source_paths: dict[str, Path] = {}
+        resources = []
+
+        for model in model_classes:
+            module = model.__module__
+            if module not in source_paths:
+                source_paths[module] = get_source_file_path(model)
+            resources.append(cls.from_model(model, source_paths[module]))
+
+        return resources
+
     @field_serializer("model_class")
     def serialize_model_class(self, klass: type[models.Model]) -> str:
         return klass.__name__
 
 
+class ModelIndexResource(BaseModel):
+    app_label: str
+    model_name: str
+    import_path: str
+
+    @classmethod
+    def from_model(cls, model: type[models.Model]) -> ModelIndexResource:
+        return cls(
+            app_label=model._meta.app_label,
+            model_name=model.__name__,
+            import_path=f"{model.__module__}.{model.__name__}",
+        )
+
+
 class SettingResource(BaseModel):
     key: str
     value: Any
@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import re
 from collections.abc import Iterable
+from collections.abc import Sequence
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -276,26 +277,35 @@ def extract_routes(
     return routes
 
 
-def get_all_routes() -> list[RouteSchema]:
+_routes_cache: tuple[URLResolver, tuple[RouteSchema, ...]] | None = None
+
+
+def get_all_routes() -> tuple[RouteSchema, ...]:
     """Get all Django URL routes by recursively walking URLconf.
 
     Traverses the entire URL resolver tree starting from ROOT_URLCONF,
     extracting route patterns, view metadata, namespaces, and parameters.
 
     Returns:
-        List of RouteSchema objects, one per URL pattern
+        Tuple of RouteSchema objects, one per URL pattern
 
     Note:
         For projects with many routes (1000+), this may take a few seconds
-        on first call. Results are not cached.
+        on first call. Results are cached until Django hands out a new root
+        resolver, e.g. when ROOT_URLCONF is overridden or the URL caches are
+        cleared. The routes are shared between callers, hence the tuple.
     """
+    global _routes_cache
+
     resolver = get_resolver()
-    routes = extract_routes(resolver.url_patterns)
-    return routes
+    if _routes_cache is None or _routes_cache[0] is not resolver:
+        _routes_cache = (resolver, tuple(extract_routes(resolver.url_patterns)))
+
+    return _routes_cache[1]
 
 
 def filter_routes(
-    routes: list[RouteSchema],
+    routes: Sequence[RouteSchema],
     method: ViewMethod | None = None,
     name: str | None = None,
     pattern: str | None = None,
@@ -315,13 +325,15 @@ def filter_routes(
     Raises:
         ValueError: If method is not a valid HTTP method name
     """
-    if method:
-        routes = [r for r in routes if not r.view.methods or method in r.view.methods]
-
-    if name is not None:
-        routes = [r for r in routes if r.name and name in r.name]
-
-    if pattern is not None:
-        routes = [r for r in routes if pattern in r.pattern]
-
-    return routes
+    if not (method or name or pattern):
+        return list(routes)
+
+    # Single pass: each check short-circuits per route, and no intermediate
+    # list is built per filter.
+    return [
+        r
+        for r in routes
+        if (not method or not r.view.methods or method in r.view.methods)
+        and (not name or (r.name and name in r.name))
+        and (not pattern or pattern in r.pattern)
+    ]
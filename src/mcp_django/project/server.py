@@ -12,9 +12,11 @@ from fastmcp.resources import ResourceContent
 from mcp.types import ToolAnnotations
 
 from .resources import AppResource
+from .resources import ModelIndexResource
 from .resources import ModelResource
 from .resources import ProjectResource
 from .resources import SettingResource
+from .resources import cache_until_registry_changes
 from .resources import filter_models
 from .routing import RouteSchema
 from .routing import ViewMethod
@@ -30,13 +32,19 @@ mcp = FastMCP(
 
 PROJECT_TOOLSET = "project"
 
+RESOURCE_ANNOTATIONS = {"readOnlyHint": True, "idempotentHint": True}
+READ_ONLY_TOOL_ANNOTATIONS = ToolAnnotations(readOnlyHint=True, idempotentHint=True)
+
+AppLabel = Annotated[str, "Django app label (e.g., 'auth', 'contenttypes', 'myapp')"]
+SettingKey = Annotated[
+    str, "Django setting key (e.g., 'DEBUG', 'DATABASES', 'INSTALLED_APPS')"
+]
+
 
 @mcp.tool(
     name="get_project_info",
-    annotations=ToolAnnotations(
-        title="Django Project Information",
-        readOnlyHint=True,
-        idempotentHint=True,
+    annotations=READ_ONLY_TOOL_ANNOTATIONS.model_copy(
+        update={"title": "Django Project Information"}
     ),
     tags={PROJECT_TOOLSET},
 )
@@ -53,13 +61,11 @@ def get_project_info() -> ProjectResource:
     "django://app/{app_label}",
     name="Django App Details",
     mime_type="application/json",
-    annotations={"readOnlyHint": True, "idempotentHint": True},
+    annotations=RESOURCE_ANNOTATIONS,
     tags={PROJECT_TOOLSET},
 )
 def get_app(
-    app_label: Annotated[
-        str, "Django app label (e.g., 'auth', 'contenttypes', 'myapp')"
-    ],
+    app_label: AppLabel,
 ) -> list[ResourceContent]:
     """Get details for a specific Django app."""
     app = AppResource.from_app(apps.get_app_config(app_label))
@@ -70,37 +76,38 @@ def get_app(
     "django://app/{app_label}/models",
     name="Django App Models",
     mime_type="application/json",
-    annotations={"readOnlyHint": True, "idempotentHint": True},
+    annotations=RESOURCE_ANNOTATIONS,
     tags={PROJECT_TOOLSET},
 )
 def get_app_models(
-    app_label: Annotated[
-        str, "Django app label (e.g., 'auth', 'contenttypes', 'myapp')"
-    ],
+    app_label: AppLabel,
 ) -> list[ResourceContent]:
     """Get all models for a specific Django app."""
     app_config = apps.get_app_config(app_label)
-    models = [
-        ModelResource.from_model(model)
-        for model in app_config.get_models()
-        if not model._meta.auto_created
-    ]
+    models = ModelResource.from_models(
+        model for model in app_config.get_models() if not model._meta.auto_created
+    )
     return [ResourceContent(models)]
 
 
+@cache_until_registry_changes
+def get_app_resources() -> list[AppResource]:
+    return list(map(AppResource.from_app, apps.get_app_configs()))
+
+
 def list_apps() -> list[AppResource]:
     """Get a list of all installed Django applications with their models.
 
     Use this to explore the project structure and available models without executing code.
     """
-    return [AppResource.from_app(app) for app in apps.get_app_configs()]
+    return get_app_resources()
 
 
 @mcp.resource(
     "django://apps",
     name="Installed Django Apps",
     mime_type="application/json",
-    annotations={"readOnlyHint": True, "idempotentHint": True},
+    annotations=RESOURCE_ANNOTATIONS,
     tags={PROJECT_TOOLSET},
 )
 def list_apps_resource() -> list[ResourceContent]:
@@ -109,10 +116,8 @@ def list_apps_resource() -> list[ResourceContent]:
 
 mcp.tool(
     name="list_apps",
-    annotations=ToolAnnotations(
-        title="List Django Apps",
-        readOnlyHint=True,
-        idempotentHint=True,
+    annotations=READ_ONLY_TOOL_ANNOTATIONS.model_copy(
+        update={"title": "List Django Apps"}
     ),
     tags={PROJECT_TOOLSET},
 )(list_apps)
@@ -122,13 +127,11 @@ mcp.tool(
     "django://model/{app_label}/{model_name}",
     name="Model Details",
     mime_type="application/json",
-    annotations={"readOnlyHint": True, "idempotentHint": True},
+    annotations=RESOURCE_ANNOTATIONS,
     tags={PROJECT_TOOLSET},
 )
 def get_model(
-    app_label: Annotated[
-        str, "Django app label (e.g., 'auth', 'contenttypes', 'myapp')"
-    ],
+    app_label: AppLabel,
     model_name: Annotated[str, "Model name (e.g., 'User', 'Group', 'Permission')"],
 ) -> list[ResourceContent]:
     """Get details for a specific Django model."""
@@ -163,11 +166,11 @@ def list_models(
         scope,
     )
 
-    all_models = list(apps.get_models())
+    all_models = apps.get_models()
     total_count = len(all_models)
 
     filtered_models = filter_models(all_models, include=include, scope=scope)
-    result = [ModelResource.from_model(model) for model in filtered_models]
+    result = ModelResource.from_models(filtered_models)
 
     logger.debug(
         "list_models completed - request_id: %s, total_models: %d, returned_models: %d",
@@ -187,26 +190,31 @@ def list_models(
 # mcp.resource(
 #     "django://models{?include,scope}",
 #     name="Django Models",
-#     annotations={"readOnlyHint": True, "idempotentHint": True},
+#     annotations=RESOURCE_ANNOTATIONS,
 #     tags={PROJECT_TOOLSET},
 # )(list_models)
 
 mcp.tool(
     name="list_models",
-    annotations=ToolAnnotations(
-        title="List Django Models",
-        readOnlyHint=True,
-        idempotentHint=True,
+    annotations=READ_ONLY_TOOL_ANNOTATIONS.model_copy(
+        update={"title": "List Django Models"}
     ),
     tags={PROJECT_TOOLSET},
 )(list_models)
 
 
+@cache_until_registry_changes
+def get_project_model_resources() -> list[ModelResource]:
+    all_models = apps.get_models()
+    filtered_models = filter_models(all_models, include=None, scope="project")
+    return ModelResource.from_models(filtered_models)
+
+
 @mcp.resource(
     "django://models",
     name="Django Models",
     mime_type="application/json",
-    annotations={"readOnlyHint": True, "idempotentHint": True},
+    annotations=RESOURCE_ANNOTATIONS,
     tags={PROJECT_TOOLSET},
 )
 def list_models_resource() -> list[ResourceContent]:
@@ -217,20 +225,37 @@ def list_models_resource() -> list[ResourceContent]:
     # Use the list_models() tool for filtering options.
     # Ref: https://github.com/jlowin/fastmcp/pull/2323
 
-    all_models = list(apps.get_models())
-    filtered_models = filter_models(all_models, include=None, scope="project")
-    models = [ModelResource.from_model(model) for model in filtered_models]
-    return [ResourceContent(models)]
+    return [ResourceContent(get_project_model_resources())]
+
+
+@cache_until_registry_changes
+def get_model_index() -> list[ModelIndexResource]:
+    return list(map(ModelIndexResource.from_model, apps.get_models()))
+
+
+@mcp.resource(
+    "django://models/index",
+    name="Django Models Index",
+    mime_type="application/json",
+    annotations=RESOURCE_ANNOTATIONS,
+    tags={PROJECT_TOOLSET},
+)
+def get_model_index_resource() -> list[ResourceContent]:
+    """Lightweight index of every installed model without field introspection.
+
+    Use django://model/{app_label}/{model_name} to fetch full details for a model.
+    """
+    return [ResourceContent(get_model_index())]
 
 
 @mcp.tool(
     name="list_routes",
-    annotations=ToolAnnotations(
-        title="List Django Routes", readOnlyHint=True, idempotentHint=True
+    annotations=READ_ONLY_TOOL_ANNOTATIONS.model_copy(
+        update={"title": "List Django Routes"}
     ),
     tags={PROJECT_TOOLSET},
 )
-async def list_routes(
+def list_routes(
     ctx: Context,
     method: Annotated[
         ViewMethod | None,
@@ -260,16 +285,13 @@ async def list_routes(
         pattern,
     )
 
-    routes = get_all_routes()
-    total_count = len(routes)
-
-    if any([method, name, pattern]):
-        routes = filter_routes(routes, method=method, name=name, pattern=pattern)
+    all_routes = get_all_routes()
+    routes = filter_routes(all_routes, method=method, name=name, pattern=pattern)
 
     logger.debug(
         "list_routes completed - request_id: %s, total_routes: %d, returned_routes: %d",
         ctx.request_id,
-        total_count,
+        len(all_routes),
         len(routes),
     )
 
@@ -280,10 +302,10 @@ async def list_routes(
     "django://route/{pattern*}",
     name="Route by Pattern",
     mime_type="application/json",
-    annotations={"readOnlyHint": True, "idempotentHint": True},
+    annotations=RESOURCE_ANNOTATIONS,
     tags={PROJECT_TOOLSET},
 )
-async def get_route_by_pattern(
+def get_route_by_pattern(
     pattern: Annotated[
         str, "URL pattern to search for (e.g., 'admin', 'api', 'users')"
     ],
@@ -295,9 +317,7 @@ async def get_route_by_pattern(
 
 
 def get_setting(
-    key: Annotated[
-        str, "Django setting key (e.g., 'DEBUG', 'DATABASES', 'INSTALLED_APPS')"
-    ],
+    key: SettingKey,
 ) -> SettingResource:
     """Get a Django setting by key.
 
@@ -312,23 +332,19 @@ def get_setting(
     "django://setting/{key}",
     name="Django Setting",
     mime_type="application/json",
-    annotations={"readOnlyHint": True, "idempotentHint": True},
+    annotations=RESOURCE_ANNOTATIONS,
     tags={PROJECT_TOOLSET},
 )
 def get_setting_resource(
-    key: Annotated[
-        str, "Django setting key (e.g., 'DEBUG', 'DATABASES', 'INSTALLED_APPS')"
-    ],
+    key: SettingKey,
 ) -> list[ResourceContent]:
     return [ResourceContent(get_setting(key))]
 
 
 mcp.tool(
     name="get_setting",
-    annotations=ToolAnnotations(
-        title="Get Django Setting",
-        readOnlyHint=True,
-        idempotentHint=True,
+    annotations=READ_ONLY_TOOL_ANNOTATIONS.model_copy(
+        update={"title": "Get Django Setting"}
     ),
     tags={PROJECT_TOOLSET},
 )(get_setting)
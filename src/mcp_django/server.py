@@ -30,15 +30,23 @@ class DjangoMCP:
     INSTRUCTIONS = "Django ecosystem MCP server providing comprehensive project introspection, stateful code execution, and development tools. Supports exploring project structure, analyzing configurations, executing Python in persistent sessions, and accessing Django ecosystem resources."
 
     def __init__(self) -> None:
-        instructions = [self.INSTRUCTIONS]
-
-        instructions.append("## Available Toolsets")
-        for toolset_server in TOOLSETS.values():
-            instructions.append(f"### {toolset_server.name}")
-            if toolset_server.instructions:
-                instructions.append(toolset_server.instructions)
-
-        self._server = FastMCP(name=self.NAME, instructions="\n\n".join(instructions))
+        instructions = "\n\n".join(
+            [
+                self.INSTRUCTIONS,
+                "## Available Toolsets",
+                *(
+                    part
+                    for toolset_server in TOOLSETS.values()
+                    for part in (
+                        f"### {toolset_server.name}",
+                        toolset_server.instructions,
+                    )
+                    if part
+                ),
+            ]
+        )
+
+        self._server = FastMCP(name=self.NAME, instructions=instructions)
         self._initialized = False
 
     @property
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import ast
+import functools
 import logging
+import threading
+import traceback
+from collections import deque
 from contextlib import redirect_stderr
 from contextlib import redirect_stdout
 from dataclasses import dataclass
@@ -9,6 +13,7 @@ from dataclasses import field
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
+from types import CodeType
 
 import django
 from asgiref.sync import sync_to_async
@@ -16,8 +21,55 @@ from django.apps import apps
 
 logger = logging.getLogger(__name__)
 
+_NL_TRANS = str.maketrans({"\n": "\\n"})
+
+
+def truncate_code(code: str, length: int = 100) -> str:
+    """Shorten code to a single-line preview suitable for log messages."""
+    ellipsis = "..." if code[length : length + 1] else ""
+    return code[:length].translate(_NL_TRANS) + ellipsis
+
+
+@functools.lru_cache(maxsize=256)
+def compile_code(code: str) -> CodeType:
+    """Compile shell code, reusing the code object for repeated snippets.
+
+    Agents often resend the same snippet while iterating, and code objects are
+    immutable, so each distinct source only needs to be compiled once.
+    """
+    return compile(code, "<string>", "exec")
+
+
+def read_capture(buffer: StringIO) -> str:
+    """Return captured output, or nothing if the snippet closed the stream."""
+    return "" if buffer.closed else buffer.getvalue()
+
+
+class CodePreview:
+    """Log argument that renders `truncate_code` only when a record is emitted.
+
+    Passing this as a `%s` argument defers the slicing and newline escaping to
+    logging's own formatting, so nothing is built for filtered-out levels. The
+    rendered preview is kept, so reusing one instance across several records
+    (or several handlers) only builds it once.
+    """
+
+    __slots__ = ("_rendered", "code", "length")
+
+    def __init__(self, code: str, length: int = 100):
+        self.code = code
+        self.length = length
+        self._rendered: str | None = None
+
+    def __str__(self) -> str:
+        if self._rendered is None:
+            self._rendered = truncate_code(self.code, self.length)
+        return self._rendered
+
 
 class DjangoShell:
+    HISTORY_MAX = 500
+
     def __init__(self):
         logger.debug("Initializing %s", self.__class__.__name__)
 
@@ -30,7 +82,10 @@ class DjangoShell:
         else:
             logger.debug("Django already initialized, skipping setup")
 
-        self.history: list[Result] = []
+        self.history: deque[Result] = deque(maxlen=self.HISTORY_MAX)
+        # Executions append from worker threads while export and clear can run
+        # concurrently, so every access to the deque goes through this lock.
+        self._history_lock = threading.Lock()
 
         logger.info("Shell initialized successfully")
 
@@ -40,8 +95,11 @@ class DjangoShell:
         Removes all entries from the shell history. Useful for starting fresh
         or removing exploratory code before exporting.
         """
-        logger.info("Clearing shell history - previous entries: %s", len(self.history))
-        self.history = []
+        with self._history_lock:
+            logger.info(
+                "Clearing shell history - previous entries: %s", len(self.history)
+            )
+            self.history.clear()
 
     def export_history(
         self,
@@ -65,35 +123,30 @@ class DjangoShell:
         Raises:
             ValueError: If an absolute path is provided for filename.
         """
+        with self._history_lock:
+            history = list(self.history)
+
         logger.info(
             "Exporting history - entries: %s, filename: %s",
-            len(self.history),
+            len(history),
             filename or "None",
         )
 
-        if not self.history:
+        if not history:
             return "# No history to export\n"
 
         imports_set = set()
         steps = []
 
-        successful_codes = [
-            result.code
-            for result in self.history
-            if not isinstance(result, ErrorResult)
+        successful_results = [
+            result for result in history if not isinstance(result, ErrorResult)
         ]
 
-        for step_num, code in enumerate(successful_codes, start=1):
-            try:
-                tree = ast.parse(code)
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.Import, ast.ImportFrom)):
-                        imports_set.add(ast.unparse(node))
-            except SyntaxError:
-                pass
+        for step_num, result in enumerate(successful_results, start=1):
+            imports_set.update(result.imports)
 
             steps.append(f"# Step {step_num}")
-            steps.append(code)
+            steps.append(result.code)
             steps.append("")
 
         script_parts = [
@@ -164,9 +217,7 @@ class DjangoShell:
             ErrorResult if execution raises an exception.
         """
 
-        code_preview = (code[:100] + "..." if len(code) > 100 else code).replace(
-            "\n", "\\n"
-        )
+        code_preview = CodePreview(code)
         logger.info("Executing code: %s", code_preview)
 
         stdout = StringIO()
@@ -174,45 +225,71 @@ class DjangoShell:
 
         with redirect_stdout(stdout), redirect_stderr(stderr):
             try:
-                logger.debug(
-                    "Code to execute: %s",
-                    code[:200] + "..." if len(code) > 200 else code,
-                )
+                logger.debug("Code to execute: %s", CodePreview(code, 200))
 
-                exec(code, {})
+                namespace: dict[str, object] = {}
+                exec(compile_code(code), namespace)
 
                 logger.debug("Code executed successfully")
 
                 return self.save_result(
                     StatementResult(
                         code=code,
-                        stdout=stdout.getvalue(),
-                        stderr=stderr.getvalue(),
+                        stdout=read_capture(stdout),
+                        stderr=read_capture(stderr),
                     )
                 )
 
             except Exception as e:
                 logger.error(
-                    "Exception during code execution: %s - Code: %s",
-                    f"{type(e).__name__}: {e}",
+                    "Exception during code execution: %s: %s - Code: %s",
+                    type(e).__name__,
+                    e,
                     code_preview,
                 )
                 logger.debug("Full traceback for error:", exc_info=True)
 
-                return self.save_result(
-                    ErrorResult(
-                        code=code,
-                        exception=e,
-                        stdout=stdout.getvalue(),
-                        stderr=stderr.getvalue(),
-                    )
+                result = ErrorResult(
+                    code=code,
+                    exception=e,
+                    stdout=read_capture(stdout),
+                    stderr=read_capture(stderr),
                 )
 
+                # The result keeps the formatted traceback, so drop the frames and
+                # the snippet globals they would otherwise keep alive in history.
+                # The namespace itself is left alone, since functions the snippet
+                # registered elsewhere still use it as their globals.
+                traceback.clear_frames(e.__traceback__)
+                e.__traceback__ = None
+
+                return self.save_result(result)
+
     def save_result(self, result: Result) -> Result:
-        self.history.append(result)
+        with self._history_lock:
+            self.history.append(result)
         return result
 
 
+def extract_imports(code: str) -> frozenset[str]:
+    """Return the normalized module-level import statements found in a snippet.
+
+    Imports nested in functions, classes or `try` blocks are left in place, since
+    hoisting them could change behaviour, e.g. an optional import guarded by
+    `except ImportError`.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return frozenset()
+
+    return frozenset(
+        ast.unparse(node)
+        for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    )
+
+
 @dataclass
 class StatementResult:
     code: str
@@ -220,7 +297,14 @@ class StatementResult:
     stderr: str
     timestamp: datetime = field(default_factory=datetime.now)
 
+    @functools.cached_property
+    def imports(self) -> frozenset[str]:
+        """Import statements in `code`, parsed once on first export."""
+        return extract_imports(self.code)
+
     def __post_init__(self):
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         logger.debug("%s created", self.__class__.__name__)
         if self.stdout:
             logger.debug("%s.stdout: %s", self.__class__.__name__, self.stdout[:200])
@@ -235,8 +319,13 @@ class ErrorResult:
     stdout: str
     stderr: str
     timestamp: datetime = field(default_factory=datetime.now)
+    traceback_lines: list[str] = field(init=False)
 
     def __post_init__(self):
+        self.traceback_lines = traceback.format_tb(self.exception.__traceback__)
+
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         logger.debug(
             "%s created - exception type: %s",
             self.__class__.__name__,
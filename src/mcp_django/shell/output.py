@@ -30,7 +30,7 @@ class DjangoShellOutput(BaseModel):
                 exception = ExceptionOutput(
                     exc_type=type(result.exception),
                     message=str(result.exception),
-                    traceback=result.exception.__traceback__,
+                    traceback=result.traceback_lines,
                 )
                 output = ErrorOutput(exception=exception)
 
@@ -75,28 +75,26 @@ class ExceptionOutput(BaseModel):
 
     exc_type: type[Exception]
     message: str
-    traceback: TracebackType | None
+    traceback: TracebackType | list[str] | None
 
     @field_serializer("exc_type")
     def serialize_exception_type(self, exc_type: type[Exception]) -> str:
         return exc_type.__name__
 
     @field_serializer("traceback")
-    def serialize_traceback(self, tb: TracebackType | None) -> list[str]:
+    def serialize_traceback(self, tb: TracebackType | list[str] | None) -> list[str]:
         if tb is None:
             return []
 
-        tb_lines = traceback.format_tb(tb)
-        relevant_tb_lines = [
-            line.strip()
-            for line in tb_lines
+        lines = tb if isinstance(tb, list) else traceback.format_tb(tb)
+        return [
+            stripped
+            for line in lines
             if "mcp_django/shell" not in line
             and "mcp_django/code" not in line
             and "mcp_django/output" not in line
-            and line.strip()
+            and (stripped := line.strip())
         ]
 
-        return relevant_tb_lines
-
 
 Output = StatementOutput | ErrorOutput
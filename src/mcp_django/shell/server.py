@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Annotated
 
@@ -7,6 +8,7 @@ from fastmcp import Context
 from fastmcp import FastMCP
 from mcp.types import ToolAnnotations
 
+from .core import CodePreview
 from .core import django_shell
 from .output import DjangoShellOutput
 from .output import ErrorOutput
@@ -52,7 +54,7 @@ async def execute(
         "django_shell execute action called - request_id: %s, client_id: %s, code: %s",
         ctx.request_id,
         ctx.client_id or "unknown",
-        (code[:100] + "..." if len(code) > 100 else code).replace("\n", "\\n"),
+        CodePreview(code),
     )
     logger.debug(
         "Full code for django_shell - request_id: %s: %s", ctx.request_id, code
@@ -116,7 +118,9 @@ async def export_history(
     )
 
     try:
-        result = django_shell.export_history(filename=filename)
+        # Safe to run alongside executions and clear_history: the export works
+        # from a snapshot of the history taken under the shell's history lock.
+        result = await asyncio.to_thread(django_shell.export_history, filename=filename)
 
         if filename:
             await ctx.debug(f"Exported history to {filename}")
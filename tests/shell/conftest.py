@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import pytest
+
+from mcp_django.shell.core import DjangoShell
+
+
+@pytest.fixture(scope="session")
+def session_shell():
+    return DjangoShell()
+
+
+@pytest.fixture
+def shell(session_shell):
+    # Executions never share globals, so history is the only per-test state.
+    yield session_shell
+    session_shell.clear_history()
@@ -1,59 +1,123 @@
 from __future__ import annotations
 
+import builtins
+import gc
 import logging
+from datetime import datetime
 
 import pytest
 from django.apps import apps
 
+from mcp_django.shell.core import CodePreview
 from mcp_django.shell.core import DjangoShell
 from mcp_django.shell.core import ErrorResult
 from mcp_django.shell.core import StatementResult
+from mcp_django.shell.core import compile_code
+from mcp_django.shell.core import truncate_code
 
 
-@pytest.fixture
-def shell():
-    shell = DjangoShell()
-    yield shell
-    shell.clear_history()
+class TestCodeExecution:
+    @pytest.mark.parametrize(
+        "code,result_type,stdout",
+        [
+            ("x = 5", StatementResult, ""),
+            ('print("Hello, World!")', StatementResult, "Hello, World!\n"),
+            (
+                'x = 5\ny = 10\nprint(f"Sum: {x + y}")\n',
+                StatementResult,
+                "Sum: 15\n",
+            ),
+            ("", StatementResult, ""),
+            ("   \n  \t  ", StatementResult, ""),
+            ("1 / 0", ErrorResult, ""),
+        ],
+        ids=["statement", "print", "multiline", "empty", "whitespace", "error"],
+    )
+    def test_execute(self, shell, code, result_type, stdout):
+        result = shell._execute(code)
 
+        assert isinstance(result, result_type)
+        assert result.stdout == stdout
 
-class TestCodeExecution:
-    def test_execute_simple_statement(self, shell):
-        result = shell._execute("x = 5")
+    def test_execute_does_not_leak_previous_output(self, shell):
+        shell._execute('print("first")')
+        result = shell._execute('print("2nd")')
 
-        assert isinstance(result, StatementResult)
+        assert result.stdout == "2nd\n"
+        assert shell.history[0].stdout == "first\n"
 
-    def test_execute_print_captures_stdout(self, shell):
-        result = shell._execute('print("Hello, World!")')
+    def test_execute_tolerates_closed_stdout(self, shell):
+        result = shell._execute("import sys; sys.stdout.close()")
 
         assert isinstance(result, StatementResult)
-        assert result.stdout == "Hello, World!\n"
+        assert result.stdout == ""
+        assert shell.history[-1] is result
+
+        result = shell._execute('print("after")')
+
+        assert result.stdout == "after\n"
+
+    def test_execute_retained_stream_does_not_leak(self, shell):
+        shell._execute("import builtins, sys; builtins._kept = sys.stdout")
+        try:
+            result = shell._execute('import builtins; builtins._kept.write("x")')
+        finally:
+            del builtins._kept
 
-    def test_execute_multiline_with_print(self, shell):
+        assert result.stdout == ""
+
+    def test_execute_error_releases_snippet_objects(self, shell):
         code = """\
-x = 5
-y = 10
-print(f"Sum: {x + y}")
-"""
-        result = shell._execute(code)
+import builtins, weakref
 
-        assert isinstance(result, StatementResult)
-        assert result.stdout == "Sum: 15\n"
+class Pinned:
+    pass
 
-    def test_execute_invalid_code_returns_error(self, shell):
-        result = shell._execute("1 / 0")
+def f(x):
+    y = [x]
+    1 / 0
 
-        assert isinstance(result, ErrorResult)
+o = Pinned()
+builtins._pinned = weakref.ref(o)
+f(o)
+"""
+        try:
+            result = shell._execute(code)
+            gc.collect()
+
+            assert isinstance(result, ErrorResult)
+            assert result.exception.__traceback__ is None
+            assert result.traceback_lines[-1].rstrip().endswith("in f")
+            assert builtins._pinned() is None
+        finally:
+            del builtins._pinned
+
+    def test_execute_error_keeps_globals_of_registered_functions(self, shell):
+        code = """\
+import builtins
 
-    def test_execute_empty_string_returns_ok(self, shell):
-        result = shell._execute("")
+K = 3
 
-        assert isinstance(result, StatementResult)
+def f():
+    return K
+
+builtins._registered = f
+1 / 0
+"""
+        try:
+            result = shell._execute(code)
 
-    def test_execute_whitespace_only_returns_ok(self, shell):
-        result = shell._execute("   \n  \t  ")
+            assert isinstance(result, ErrorResult)
+            assert builtins._registered() == 3
+        finally:
+            del builtins._registered
 
-        assert isinstance(result, StatementResult)
+    @pytest.mark.parametrize("code", ["x = 5", "1 / 0"])
+    def test_result_timestamp(self, shell, code):
+        before = datetime.now()
+        result = shell._execute(code)
+
+        assert before <= result.timestamp <= datetime.now()
 
     @pytest.mark.asyncio
     async def test_async_execute_returns_result(self):
@@ -64,12 +128,77 @@ print(f"Sum: {x + y}")
         assert isinstance(result, StatementResult)
 
 
+class TestTruncateCode:
+    def test_short_code_is_unchanged(self):
+        assert truncate_code("x = 5") == "x = 5"
+
+    def test_code_at_length_has_no_ellipsis(self):
+        assert truncate_code("x" * 100) == "x" * 100
+
+    def test_long_code_is_truncated(self):
+        assert truncate_code("x" * 101) == "x" * 100 + "..."
+
+    def test_newlines_are_escaped(self):
+        assert truncate_code("x = 5\nprint(x)") == "x = 5\\nprint(x)"
+
+    def test_custom_length(self):
+        assert truncate_code("abcdef", 3) == "abc..."
+
+
+class TestCompileCode:
+    def test_reuses_code_object(self):
+        assert compile_code("x = 5") is compile_code("x = 5")
+
+    def test_syntax_error_is_raised(self):
+        with pytest.raises(SyntaxError):
+            compile_code("def")
+
+    def test_syntax_error_returns_error_result(self, shell):
+        result = shell._execute("def")
+
+        assert isinstance(result, ErrorResult)
+        assert isinstance(result.exception, SyntaxError)
+
+
+class TestCodePreview:
+    def test_str_renders_truncated_code(self):
+        assert str(CodePreview("x" * 101)) == "x" * 100 + "..."
+
+    def test_custom_length(self):
+        assert str(CodePreview("x = 5\ny = 6", 5)) == "x = 5..."
+
+    def test_rendered_once(self, monkeypatch):
+        calls = []
+
+        def fake_truncate(code, length):
+            calls.append(code)
+            return code
+
+        monkeypatch.setattr("mcp_django.shell.core.truncate_code", fake_truncate)
+        preview = CodePreview("x = 5")
+
+        assert str(preview) == "x = 5"
+        assert str(preview) == "x = 5"
+        assert calls == ["x = 5"]
+
+    def test_not_rendered_when_level_disabled(self, caplog, monkeypatch):
+        caplog.set_level(logging.WARNING)
+        logger = logging.getLogger("mcp_django.shell.core")
+
+        def fail(self):
+            raise AssertionError("preview rendered")
+
+        monkeypatch.setattr(CodePreview, "__str__", fail)
+
+        logger.info("Executing code: %s", CodePreview("x = 5"))
+
+
 class TestShellState:
     def test_init_django_setup_completes(self):
         shell = DjangoShell()
 
         assert apps.ready
-        assert shell.history == []
+        assert len(shell.history) == 0
 
     def test_execution_uses_fresh_globals(self, shell):
         """Verify each execution uses fresh globals (stateless)."""
@@ -82,6 +211,15 @@ class TestShellState:
         assert isinstance(result, ErrorResult)
         assert isinstance(result.exception, NameError)
 
+    def test_history_keeps_most_recent_entries(self, monkeypatch):
+        monkeypatch.setattr(DjangoShell, "HISTORY_MAX", 2)
+        shell = DjangoShell()
+
+        for i in range(3):
+            shell._execute(f"x = {i}")
+
+        assert [result.code for result in shell.history] == ["x = 1", "x = 2"]
+
     def test_clear_history_clears_history_only(self, shell):
         """Verify clear_history clears the execution history."""
         shell._execute("x = 42")
@@ -1,19 +1,12 @@
 from __future__ import annotations
 
 import os
+import sys
+import threading
 from pathlib import Path
 
 import pytest
 
-from mcp_django.shell.core import DjangoShell
-
-
-@pytest.fixture
-def shell():
-    shell = DjangoShell()
-    yield shell
-    shell.clear_history()
-
 
 class TestExportHistory:
     def test_export_empty_history(self, shell):
@@ -204,6 +197,67 @@ class TestExportHistory:
 
         assert "if x == 1:" in script
 
+    def test_export_only_hoists_module_level_imports(self, shell):
+        """Imports nested in blocks stay where they are."""
+        shell._execute(
+            "try:\n    import tomllib\nexcept ImportError:\n    tomllib = None"
+        )
+
+        script = shell.export_history()
+        header = script.split("# Step 1")[0]
+
+        assert "import tomllib" not in header
+        assert "    import tomllib" in script
+
+    def test_export_parses_each_result_once(self, shell, monkeypatch):
+        """Repeated exports reuse each result's parsed imports."""
+        from mcp_django.shell import core
+
+        shell._execute("import os\nx = os.sep")
+
+        calls = []
+        extract_imports = core.extract_imports
+
+        def counting_extract_imports(code):
+            calls.append(code)
+            return extract_imports(code)
+
+        monkeypatch.setattr(core, "extract_imports", counting_extract_imports)
+
+        first = shell.export_history()
+        second = shell.export_history()
+
+        assert calls == ["import os\nx = os.sep"]
+        assert "import os\n\n# Step 1" in first
+        assert second.split("\n")[2:] == first.split("\n")[2:]
+
+    def test_export_while_history_is_mutated(self, shell):
+        """Export reads a snapshot while another thread appends to history."""
+        # Switch threads as often as possible so an unguarded iteration over the
+        # deque reliably overlaps an append; restored below.
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        result = shell._execute("x = 1")
+        stop = threading.Event()
+
+        def mutate():
+            while not stop.is_set():
+                shell.save_result(result)
+
+        thread = threading.Thread(target=mutate)
+        thread.start()
+        try:
+            scripts = [shell.export_history() for _ in range(300)]
+        finally:
+            stop.set()
+            thread.join()
+            sys.setswitchinterval(switch_interval)
+
+        for script in scripts:
+            assert script.startswith("# Django Shell Session Export")
+            assert "# Step 1\nx = 1\n" in script
+            compile(script, "<export>", "exec")
+
 
 class TestClearHistory:
     def test_clear_history_clears_entries(self, shell):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -184,6 +185,19 @@ async def test_shell_export_history_to_file(tmp_path):
         os.chdir(old_cwd)
 
 
+async def test_shell_export_history_concurrent_with_execute():
+    """Exports running off the event loop see a consistent history snapshot."""
+    async with Client(mcp.server) as client:
+        await asyncio.gather(
+            *(
+                client.call_tool("shell_execute", {"code": f"x = {i}"})
+                for i in range(10)
+            ),
+            *(client.call_tool("shell_export_history") for _ in range(10)),
+            client.call_tool("shell_clear_history"),
+        )
+
+
 async def test_shell_export_history_error_handling():
     """Test that export_history handles exceptions gracefully."""
     from unittest.mock import patch
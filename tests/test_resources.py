@@ -13,6 +13,7 @@ from mcp_django.project.resources import ModelResource
 from mcp_django.project.resources import ProjectResource
 from mcp_django.project.resources import PythonResource
 from mcp_django.project.resources import SettingResource
+from mcp_django.project.resources import cache_until_registry_changes
 from mcp_django.project.resources import get_source_file_path
 from mcp_django.project.resources import is_first_party_app
 from tests.models import AModel
@@ -185,6 +186,36 @@ def test_model_resource_from_model():
     assert data["model_class"] == "AModel"
 
 
+def test_model_resource_from_models():
+    results = ModelResource.from_models([AModel])
+
+    assert results == [ModelResource.from_model(AModel)]
+
+
+def test_model_resource_from_models_shares_module_source_path(monkeypatch):
+    from mcp_django.project import resources
+
+    lookups = []
+    original = resources.get_source_file_path
+
+    def counting_get_source_file_path(obj):
+        lookups.append(obj)
+        return original(obj)
+
+    monkeypatch.setattr(
+        resources, "get_source_file_path", counting_get_source_file_path
+    )
+
+    with override_settings(
+        INSTALLED_APPS=settings.INSTALLED_APPS + ["django.contrib.auth"]
+    ):
+        results = ModelResource.from_models(apps.get_app_config("auth").get_models())
+
+    assert len(results) > 1
+    assert len(lookups) == 1
+    assert {result.source_path for result in results} == {original(lookups[0])}
+
+
 def test_setting_resource_with_bool():
     result = SettingResource(key="DEBUG", value=False, value_type="bool")
 
@@ -232,3 +263,35 @@ def test_setting_resource_serializes_class():
     data = result.model_dump()
     assert data["value"] == "tests.models.AModel"
     assert isinstance(data["value"], str)
+
+
+def test_cache_until_registry_changes():
+    calls = []
+
+    @cache_until_registry_changes
+    def build():
+        calls.append(None)
+        return len(calls)
+
+    assert build() == 1
+    assert build() == 1
+
+    apps.clear_cache()
+
+    assert build() == 2
+    assert build() == 2
+
+
+def test_cache_until_registry_changes_with_installed_apps_override():
+    @cache_until_registry_changes
+    def app_labels():
+        return [app.label for app in apps.get_app_configs()]
+
+    assert "auth" not in app_labels()
+
+    with override_settings(
+        INSTALLED_APPS=settings.INSTALLED_APPS + ["django.contrib.auth"]
+    ):
+        assert "auth" in app_labels()
+
+    assert "auth" not in app_labels()
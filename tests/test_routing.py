@@ -4,6 +4,7 @@ import inspect
 from pathlib import Path
 
 import pytest
+from django.urls import clear_url_caches
 
 from mcp_django.project.routing import ClassViewSchema
 from mcp_django.project.routing import FunctionViewSchema
@@ -327,6 +328,21 @@ def test_filter_routes_combines_criteria_with_and(sample_routes):
     assert filtered[0].name == "api_users"
 
 
+def test_filter_routes_without_filters_returns_routes(sample_routes):
+    assert filter_routes(tuple(sample_routes)) == sample_routes
+
+
+def test_filter_routes_empty_strings_combined_with_method(sample_routes):
+    filtered = filter_routes(sample_routes, method=ViewMethod.GET, name="", pattern="")
+
+    assert filtered == filter_routes(sample_routes, method=ViewMethod.GET)
+    assert any(route.name is None for route in filtered)
+
+
+def test_filter_routes_empty_strings_return_all_routes(sample_routes):
+    assert filter_routes(tuple(sample_routes), name="", pattern="") == sample_routes
+
+
 def test_filter_routes_empty_list():
     filtered = filter_routes([])
     assert filtered == []
@@ -365,3 +381,20 @@ def test_route_count_matches_urlconf_integration():
 
     for expected in expected_routes:
         assert expected in route_names, f"Expected route '{expected}' not found"
+
+
+def test_get_all_routes_is_cached():
+    routes = get_all_routes()
+
+    assert isinstance(routes, tuple)
+    assert get_all_routes() is routes
+
+
+def test_get_all_routes_rebuilds_after_url_caches_cleared():
+    routes = get_all_routes()
+
+    clear_url_caches()
+
+    rebuilt = get_all_routes()
+    assert rebuilt is not routes
+    assert [r.pattern for r in rebuilt] == [r.pattern for r in routes]
@@ -66,6 +66,20 @@ async def test_tool_listing():
             assert tool_name in tool_names
 
 
+async def test_read_only_tool_annotations():
+    async with Client(mcp.server) as client:
+        tools = {tool.name: tool for tool in await client.list_tools()}
+
+        list_apps = tools["project_list_apps"].annotations
+        search = tools["djangopackages_search"].annotations
+
+        assert list_apps.title == "List Django Apps"
+        assert list_apps.readOnlyHint is True
+        assert list_apps.idempotentHint is True
+        assert search.title == "Search djangopackages.org"
+        assert search.readOnlyHint is True
+
+
 async def test_get_apps_resource():
     async with Client(mcp.server) as client:
         contents = await client.read_resource("django://project/apps")
@@ -82,6 +96,18 @@ async def test_get_models_resource():
         assert any(model["model_class"] == "AModel" for model in models)
 
 
+async def test_get_models_index_resource():
+    async with Client(mcp.server) as client:
+        contents = await client.read_resource("django://project/models/index")
+        index = load_json_resource(contents)
+
+        assert {
+            "app_label": "tests",
+            "model_name": "AModel",
+            "import_path": "tests.models.AModel",
+        } in index
+
+
 async def test_get_project_info_tool():
     async with Client(mcp.server) as client:
         result = await client.call_tool("project_get_project_info", {})
@@ -94,6 +120,16 @@ async def test_get_project_info_tool():
         assert result.data.django.version is not None
 
 
+async def test_get_project_info_tool_reflects_environment(monkeypatch):
+    async with Client(mcp.server) as client:
+        await client.call_tool("project_get_project_info", {})
+
+        monkeypatch.setenv("DJANGO_SETTINGS_MODULE", "changed.settings")
+        result = await client.call_tool("project_get_project_info", {})
+
+        assert result.data.django.settings_module == "changed.settings"
+
+
 @override_settings(
     INSTALLED_APPS=settings.INSTALLED_APPS
     + [
@@ -132,6 +168,16 @@ async def test_list_routes_tool_with_filters():
             assert isinstance(pattern_routes.data, list)
 
 
+async def test_list_routes_tool_empty_filters_return_all_routes():
+    async with Client(mcp.server) as client:
+        all_routes = await client.call_tool("project_list_routes", {})
+        result = await client.call_tool(
+            "project_list_routes", {"name": "", "pattern": ""}
+        )
+
+        assert len(result.data) == len(all_routes.data)
+
+
 async def test_list_apps_tool():
     async with Client(mcp.server) as client:
         result = await client.call_tool("project_list_apps", {})
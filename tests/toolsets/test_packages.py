@@ -1,17 +1,90 @@
 from __future__ import annotations
 
+import asyncio
 import json
 
 import httpx
 import pytest
 import pytest_asyncio
 from fastmcp import Client
+from fastmcp.exceptions import ToolError
 
+from mcp_django.packages.client import DjangoPackagesClient
+from mcp_django.packages.client import djangopackages_client
 from mcp_django.packages.client import extract_slug_from_url
 from mcp_django.packages.client import extract_slugs_from_urls
 from mcp_django.packages.client import parse_participant_list
 from mcp_django.server import mcp
 
+GRID_DETAIL = {
+    "slug": "rest-frameworks",
+    "title": "REST frameworks",
+    "description": "Packages for building REST APIs",
+    "packages": [
+        "/api/v3/packages/package-1/",
+        "/api/v3/packages/package-2/",
+    ],
+    "is_locked": False,
+    "header": False,
+}
+
+PACKAGE_DETAIL = {
+    "slug": "django-debug-toolbar",
+    "title": "django-debug-toolbar",
+    "category": "/api/v3/categories/apps/",
+    "grids": [
+        "/api/v3/grids/grid-21/",
+        "/api/v3/grids/grid-11/",
+    ],
+    "modified": "2024-06-01T07:50:28",
+    "repo_url": "https://github.com/jazzband/django-debug-toolbar",
+    "pypi_version": "4.3.0",
+    "pypi_url": "http://pypi.python.org/pypi/django-debug-toolbar",
+    "documentation_url": "https://readthedocs.org/projects/django-debug-toolbar",
+    "repo_forks": 1027,
+    "repo_description": "A configurable set of panels that display various debug information",
+    "repo_watchers": 7937,
+    "participants": "user-1,user-2",
+}
+
+SEARCH_RESULTS = [
+    {
+        "id": 1,
+        "title": "django-allauth",
+        "slug": "django-allauth",
+        "description": "Integrated set of Django applications addressing authentication",
+        "category": "App",
+        "item_type": "package",
+        "pypi_url": "https://pypi.org/project/django-allauth/",
+        "repo_url": "https://github.com/pennersr/django-allauth",
+        "documentation_url": "https://docs.allauth.org/",
+        "repo_watchers": 8500,
+        "last_committed": "2024-01-15T10:30:00",
+        "last_released": None,
+    },
+    {
+        "id": 2,
+        "title": "django-oauth-toolkit",
+        "slug": "django-oauth-toolkit",
+        "description": "OAuth2 goodies for Django",
+        "category": "App",
+        "item_type": "package",
+        "pypi_url": "https://pypi.org/project/django-oauth-toolkit/",
+        "repo_url": "https://github.com/jazzband/django-oauth-toolkit",
+        "documentation_url": "https://django-oauth-toolkit.readthedocs.io/",
+        "repo_watchers": 2900,
+        "last_committed": None,
+        "last_released": "2024-01-10T14:20:00",
+    },
+    {
+        "id": 3,
+        "title": "Authentication",
+        "slug": "authentication",
+        "description": "This is a grid of all packages for user authentication.",
+        "item_type": "grid",
+    },
+]
+
 
 def load_json_resource(contents):
     assert len(contents) == 1
@@ -24,10 +97,33 @@ async def initialize_mcp_server():
     await mcp.initialize()
 
 
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    djangopackages_client.clear_cache()
+    yield
+    djangopackages_client.clear_cache()
+
+
 def test_extract_slug_from_url_with_none():
     assert extract_slug_from_url(None) is None
 
 
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("https://djangopackages.org/api/v3/grids/rest-frameworks/", "rest-frameworks"),
+        ("/api/v3/packages/django-debug-toolbar", "django-debug-toolbar"),
+        ("django-debug-toolbar", "django-debug-toolbar"),
+    ],
+)
+def test_extract_slug_from_url(value, expected):
+    assert extract_slug_from_url(value) == expected
+
+
+def test_extract_slugs_from_urls_skips_empty():
+    assert extract_slugs_from_urls(["/api/v3/packages/a/", "", "b"]) == ["a", "b"]
+
+
 def test_extract_slugs_from_urls_with_none():
     assert extract_slugs_from_urls(None) is None
 
@@ -36,25 +132,223 @@ def test_parse_participant_list_with_none():
     assert parse_participant_list(None) is None
 
 
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("user-1,user-2", 2),
+        ("user-1, ,user-2,", 2),
+        ("", 0),
+        (["user-1", " ", ""], 1),
+    ],
+)
+def test_parse_participant_list(value, expected):
+    assert parse_participant_list(value) == expected
+
+
+@pytest.mark.asyncio
+async def test_client_context_manager_closes_http_client():
+    async with DjangoPackagesClient() as client:
+        assert not client.client.is_closed
+
+    assert client.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_client_base_urls_can_be_overridden(
+    mock_packages_grid_detail_api, respx_mock
+):
+    route = respx_mock.get("https://mirror.example/api/v3/grids/rest-frameworks/")
+    route.mock(return_value=httpx.Response(200, json=mock_packages_grid_detail_api))
+
+    async with DjangoPackagesClient() as client:
+        client.BASE_URL_V3 = "https://mirror.example/api/v3"
+        grid = await client.get_grid("rest-frameworks")
+
+    assert route.called
+    assert grid.slug == "rest-frameworks"
+
+
+@pytest.mark.asyncio
+async def test_tools_share_client(mock_packages_grid_detail_api):
+    async with Client(mcp.server) as client:
+        await client.call_tool("djangopackages_get_grid", {"slug": "rest-frameworks"})
+        http_client = djangopackages_client.client
+        djangopackages_client.clear_cache()
+        await client.call_tool("djangopackages_get_grid", {"slug": "rest-frameworks"})
+
+        assert djangopackages_client.client is http_client
+        assert not http_client.is_closed
+
+    assert http_client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_closed_client_reopens_on_next_request(mock_packages_grid_detail_api):
+    await djangopackages_client.aclose()
+
+    grid = await djangopackages_client.get_grid("rest-frameworks")
+
+    assert grid.slug == "rest-frameworks"
+    assert not djangopackages_client.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_get_grid_is_cached(mock_packages_grid_detail_api, respx_mock):
+    first = await djangopackages_client.get_grid("rest-frameworks")
+    second = await djangopackages_client.get_grid("rest-frameworks")
+
+    assert second is first
+    assert respx_mock.calls.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_methods_accept_keyword_arguments(
+    mock_packages_grid_detail_api, respx_mock
+):
+    respx_mock.get("https://djangopackages.org/api/v4/search/").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+
+    first = await djangopackages_client.get_grid(slug_or_id="rest-frameworks")
+    second = await djangopackages_client.get_grid("rest-frameworks")
+    await djangopackages_client.search(query="auth")
+
+    assert second is first
+    assert respx_mock.calls.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_request(
+    mock_packages_package_detail_api, respx_mock
+):
+    first, second = await asyncio.gather(
+        djangopackages_client.get_package("django-debug-toolbar"),
+        djangopackages_client.get_package(slug_or_id="django-debug-toolbar"),
+    )
+    packages = await djangopackages_client.get_packages(
+        ["django-debug-toolbar", "django-debug-toolbar"]
+    )
+
+    assert second is first
+    assert packages == [first, first]
+    assert respx_mock.calls.call_count == 1
+    assert djangopackages_client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_request_is_shared_and_not_cached(respx_mock):
+    route = respx_mock.get("https://djangopackages.org/api/v3/grids/missing/")
+    route.mock(return_value=httpx.Response(500))
+
+    results = await asyncio.gather(
+        djangopackages_client.get_grid("missing"),
+        djangopackages_client.get_grid("missing"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+    assert route.call_count == 1
+    assert djangopackages_client._inflight == {}
+    assert djangopackages_client._cache == {}
+
+
+@pytest.mark.asyncio
+async def test_get_grid_cache_expires(
+    mock_packages_grid_detail_api, respx_mock, monkeypatch
+):
+    await djangopackages_client.get_grid("rest-frameworks")
+
+    monkeypatch.setattr(DjangoPackagesClient, "CACHE_TTL", 0.0)
+    await djangopackages_client.get_grid("rest-frameworks")
+
+    assert respx_mock.calls.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_is_cached(respx_mock):
+    respx_mock.get("https://djangopackages.org/api/v4/search/").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+
+    await djangopackages_client.search("auth")
+    await djangopackages_client.search("auth")
+    await djangopackages_client.search("rest")
+
+    assert respx_mock.calls.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used(
+    mock_packages_grid_detail_api, respx_mock, monkeypatch
+):
+    respx_mock.get("https://djangopackages.org/api/v4/search/").mock(
+        return_value=httpx.Response(200, json=[])
+    )
+    monkeypatch.setattr(DjangoPackagesClient, "CACHE_MAXSIZE", 2)
+
+    await djangopackages_client.get_grid("rest-frameworks")
+    await djangopackages_client.search("auth")
+    await djangopackages_client.get_grid("rest-frameworks")
+    await djangopackages_client.search("rest")
+
+    assert list(djangopackages_client._cache) == [
+        ("get_grid", "rest-frameworks"),
+        ("search", "rest"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_revalidated_with_etag(
+    mock_packages_grid_detail_api, respx_mock, monkeypatch
+):
+    route = respx_mock.get("https://djangopackages.org/api/v3/grids/rest-frameworks/")
+    route.side_effect = [
+        httpx.Response(
+            200, json=mock_packages_grid_detail_api, headers={"ETag": '"v1"'}
+        ),
+        httpx.Response(304),
+    ]
+    monkeypatch.setattr(DjangoPackagesClient, "CACHE_TTL", 0.0)
+
+    first = await djangopackages_client.get_grid("rest-frameworks")
+    second = await djangopackages_client.get_grid("rest-frameworks")
+
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_etag_store_is_bounded(respx_mock, monkeypatch):
+    respx_mock.get("https://djangopackages.org/api/v4/search/").mock(
+        return_value=httpx.Response(200, json=[], headers={"ETag": '"v1"'})
+    )
+    monkeypatch.setattr(DjangoPackagesClient, "CACHE_MAXSIZE", 1)
+
+    await djangopackages_client.search("auth")
+    await djangopackages_client.search("rest")
+
+    assert list(djangopackages_client._etags) == [
+        "https://djangopackages.org/api/v4/search/?q=rest"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_error_response_raises(respx_mock):
+    respx_mock.get("https://djangopackages.org/api/v3/grids/missing/").mock(
+        return_value=httpx.Response(404)
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await djangopackages_client.get_grid("missing")
+
+
 @pytest.fixture
 def mock_packages_grid_detail_api(respx_mock):
-    grid_data = {
-        "slug": "rest-frameworks",
-        "title": "REST frameworks",
-        "description": "Packages for building REST APIs",
-        "packages": [
-            "/api/v3/packages/package-1/",
-            "/api/v3/packages/package-2/",
-        ],
-        "is_locked": False,
-        "header": False,
-    }
-
     respx_mock.get("https://djangopackages.org/api/v3/grids/rest-frameworks/").mock(
-        return_value=httpx.Response(200, json=grid_data)
+        return_value=httpx.Response(200, json=GRID_DETAIL)
     )
 
-    return grid_data
+    return GRID_DETAIL
 
 
 @pytest.mark.asyncio
@@ -79,30 +373,11 @@ async def test_get_grid_tool(mock_packages_grid_detail_api):
 
 @pytest.fixture
 def mock_packages_package_detail_api(respx_mock):
-    package_data = {
-        "slug": "django-debug-toolbar",
-        "title": "django-debug-toolbar",
-        "category": "/api/v3/categories/apps/",
-        "grids": [
-            "/api/v3/grids/grid-21/",
-            "/api/v3/grids/grid-11/",
-        ],
-        "modified": "2024-06-01T07:50:28",
-        "repo_url": "https://github.com/jazzband/django-debug-toolbar",
-        "pypi_version": "4.3.0",
-        "pypi_url": "http://pypi.python.org/pypi/django-debug-toolbar",
-        "documentation_url": "https://readthedocs.org/projects/django-debug-toolbar",
-        "repo_forks": 1027,
-        "repo_description": "A configurable set of panels that display various debug information",
-        "repo_watchers": 7937,
-        "participants": "user-1,user-2",
-    }
-
     respx_mock.get(
         "https://djangopackages.org/api/v3/packages/django-debug-toolbar/"
-    ).mock(return_value=httpx.Response(200, json=package_data))
+    ).mock(return_value=httpx.Response(200, json=PACKAGE_DETAIL))
 
-    return package_data
+    return PACKAGE_DETAIL
 
 
 @pytest.mark.asyncio
@@ -126,47 +401,41 @@ async def test_get_package_tool(mock_packages_package_detail_api):
 
 
 @pytest.mark.asyncio
-async def test_search_djangopackages_tool(respx_mock):
-    search_data = [
-        {
-            "id": 1,
-            "title": "django-allauth",
-            "slug": "django-allauth",
-            "description": "Integrated set of Django applications addressing authentication",
-            "category": "App",
-            "item_type": "package",
-            "pypi_url": "https://pypi.org/project/django-allauth/",
-            "repo_url": "https://github.com/pennersr/django-allauth",
-            "documentation_url": "https://docs.allauth.org/",
-            "repo_watchers": 8500,
-            "last_committed": "2024-01-15T10:30:00",
-            "last_released": None,
-        },
-        {
-            "id": 2,
-            "title": "django-oauth-toolkit",
-            "slug": "django-oauth-toolkit",
-            "description": "OAuth2 goodies for Django",
-            "category": "App",
-            "item_type": "package",
-            "pypi_url": "https://pypi.org/project/django-oauth-toolkit/",
-            "repo_url": "https://github.com/jazzband/django-oauth-toolkit",
-            "documentation_url": "https://django-oauth-toolkit.readthedocs.io/",
-            "repo_watchers": 2900,
-            "last_committed": None,
-            "last_released": "2024-01-10T14:20:00",
-        },
-        {
-            "id": 3,
-            "title": "Authentication",
-            "slug": "authentication",
-            "description": "This is a grid of all packages for user authentication.",
-            "item_type": "grid",
-        },
-    ]
+async def test_get_packages_tool(mock_packages_package_detail_api, respx_mock):
+    respx_mock.get("https://djangopackages.org/api/v3/packages/django-silk/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                **mock_packages_package_detail_api,
+                "slug": "django-silk",
+                "title": "django-silk",
+            },
+        )
+    )
+
+    async with Client(mcp.server) as client:
+        result = await client.call_tool(
+            "djangopackages_get_packages",
+            {"slugs": ["django-silk", "django-debug-toolbar"]},
+        )
+
+        slugs = [package["slug"] for package in result.structured_content["result"]]
+        assert slugs == ["django-silk", "django-debug-toolbar"]
+
 
+@pytest.mark.asyncio
+async def test_get_packages_tool_rejects_too_many_slugs():
+    async with Client(mcp.server) as client:
+        with pytest.raises(ToolError):
+            await client.call_tool(
+                "djangopackages_get_packages", {"slugs": ["package"] * 51}
+            )
+
+
+@pytest.mark.asyncio
+async def test_search_djangopackages_tool(respx_mock):
     respx_mock.get("https://djangopackages.org/api/v4/search/").mock(
-        return_value=httpx.Response(200, json=search_data)
+        return_value=httpx.Response(200, json=SEARCH_RESULTS)
     )
     async with Client(mcp.server) as client:
         result = await client.call_tool(